@@ -13,17 +13,28 @@ devise your own ``selection_strategy``. We recommend using
 :mod:`PermutationImportance.selection_strategies` as a template for implementing 
 your own variable importance method."""
 
-import numpy as np
 import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
-from .data_verification import verify_data, determine_variable_names
-from .multiprocessing_utils import pool_imap_unordered
+from .data_verification import verify_data, coerce_inputs, determine_variable_names
+from .error_handling import InvalidInputException
+from .multiprocessing_utils import WorkerPool, SharedArray, share_array, unshare_array
 from .result import ImportanceResult
 from .scoring_strategies import verify_scoring_strategy
+from .selection_strategies import ColumnSelectionStrategy, SequentialForwardSelectionStrategy, SequentialBackwardSelectionStrategy, PermutationImportanceSelectionStrategy
 from .utils import add_ranks_to_dict, get_data_subset
 
 
-def abstract_variable_importance(training_data, scoring_data, scoring_fn, scoring_strategy, selection_strategy, variable_names=None, nimportant_vars=None, method=None, njobs=1):
+# Strategies which yield fresh datasets without touching the global random state
+# while iterating, so that the next datasets can be prepared while scoring
+_PREFETCH_SAFE_STRATEGIES = (SequentialForwardSelectionStrategy,
+                             SequentialBackwardSelectionStrategy,
+                             PermutationImportanceSelectionStrategy)
+
+
+def abstract_variable_importance(training_data, scoring_data, scoring_fn, scoring_strategy, selection_strategy, variable_names=None, nimportant_vars=None, method=None, njobs=1, batched_scoring_fn=None, dtype=None):
     """Performs an abstract variable importance over data given a particular
     set of functions for scoring, determining optimal variables, and selecting
     data
@@ -33,7 +44,9 @@ def abstract_variable_importance(training_data, scoring_data, scoring_fn, scorin
     :param scoring_data: a 2-tuple ``(inputs, outputs)`` for scoring in the
         ``scoring_fn``
     :param scoring_fn: a function to be used for scoring. Should be of the form
-        ``(training_data, scoring_data) -> some_value``
+        ``(training_data, scoring_data) -> some_value``. The data may be
+        read-only views of the original data, so it must not be modified in
+        place
     :param scoring_strategy: a function to be used for determining optimal
         variables. Should be of the form ``([some_value]) -> index``
     :param variable_names: an optional list for variable names. If not given,
@@ -45,12 +58,36 @@ def abstract_variable_importance(training_data, scoring_data, scoring_fn, scorin
         name of the ``selection_strategy`` if not given
     :param njobs: an integer for the number of threads to use. If negative, will
         use ``num_cpus + njobs``. Defaults to 1
+    :param batched_scoring_fn: an optional function for scoring all variables
+        at once. Should be of the form 
+        ``(training_data, scoring_data, [columns]) -> [some_value]``, where 
+        each ``columns`` is a list of column indices and one value is returned
+        for each. If given, is used in place of ``scoring_fn`` for each
+        variable, so ``njobs`` must be 1. Requires that the
+        ``selection_strategy`` is a
+        :class:`PermutationImportance.selection_strategies.ColumnSelectionStrategy`
+    :param dtype: an optional dtype (e.g. ``np.float32``) to convert the inputs
+        of the data to once up front. Lower precision halves the memory traffic
+        of BLAS-heavy ``scoring_fn``. Defaults to None, which leaves the data
+        unchanged
     :returns: :class:`PermutationImportance.result.ImportanceResult` object 
         which contains the results for each run
     """
 
-    training_data = verify_data(training_data)
-    scoring_data = verify_data(scoring_data)
+    is_column_strategy = isinstance(selection_strategy, type) and issubclass(
+        selection_strategy, ColumnSelectionStrategy)
+    if batched_scoring_fn is not None:
+        if not is_column_strategy:
+            raise InvalidInputException(
+                selection_strategy, "Batched scoring requires a ColumnSelectionStrategy")
+        if njobs != 1:
+            raise InvalidInputException(
+                njobs, "Batched scoring cannot be combined with njobs other than 1")
+
+    # Column-major inputs make selecting columns a contiguous copy. As the
+    # columns are then handed out as views, the data is made read-only
+    training_data, scoring_data = _coerce_datasets(verify_data(training_data), verify_data(
+        scoring_data), dtype, order="F" if is_column_strategy else None, read_only=is_column_strategy)
     scoring_strategy = verify_scoring_strategy(scoring_strategy)
     variable_names = determine_variable_names(scoring_data, variable_names)
     nimportant_vars = len(
@@ -61,32 +98,79 @@ def abstract_variable_importance(training_data, scoring_data, scoring_fn, scorin
 
     important_vars = list()
     num_vars = len(variable_names)
+    name_to_index = {name: i for i, name in enumerate(variable_names)}
 
     # Compute the original score over all the data
     original_score = scoring_fn(training_data, scoring_data)
     result_obj = ImportanceResult(method, variable_names, original_score)
-    for _ in range(nimportant_vars):
-        selection_iter = selection_strategy(
-            training_data, scoring_data, num_vars, important_vars)
-        if njobs == 1:
-            result = _singlethread_iteration(
-                selection_iter, scoring_fn)
-        else:
-            result = _multithread_iteration(
-                selection_iter, scoring_fn, njobs)
-        next_result = add_ranks_to_dict(
-            result, variable_names, scoring_strategy)
-        best_var = min(
-            next_result.keys(), key=lambda key: next_result[key][0])
-        best_index = np.flatnonzero(variable_names == best_var)[0]
-        result_obj.add_new_results(
-            next_result, next_important_variable=best_var)
-        important_vars.append(best_index)
+    pool = None
+    try:
+        for _ in range(nimportant_vars):
+            selection_iter = selection_strategy(
+                training_data, scoring_data, num_vars, important_vars)
+            if batched_scoring_fn is not None:
+                result = _batched_iteration(selection_iter, batched_scoring_fn)
+            elif njobs == 1:
+                # Only the built-in strategies are known to yield fresh data,
+                # so only they are safe to run ahead of the scoring
+                result = _singlethread_iteration(
+                    selection_iter, scoring_fn, prefetch=type(selection_iter) in _PREFETCH_SAFE_STRATEGIES)
+            else:
+                if pool is None:
+                    # The same processes are reused for every pass
+                    pool = _make_worker_pool(selection_iter, scoring_fn, njobs)
+                # Send each worker several variables at once to amortize overhead
+                chunksize = max(
+                    1, (num_vars - len(important_vars)) // (4 * njobs))
+                result = _multithread_iteration(
+                    selection_iter, scoring_fn, njobs, chunksize=chunksize, pool=pool)
+            next_result = add_ranks_to_dict(
+                result, variable_names, scoring_strategy)
+            best_var = min(
+                next_result.keys(), key=lambda key: next_result[key][0])
+            best_index = name_to_index[best_var]
+            result_obj.add_new_results(
+                next_result, next_important_variable=best_var)
+            important_vars.append(best_index)
+    finally:
+        if pool is not None:
+            pool.close()
 
     return result_obj
 
 
-def _singlethread_iteration(selection_iterator, scoring_fn):
+def _coerce_datasets(training_data, scoring_data, dtype=None, order=None, read_only=False):
+    """Coerces the inputs of the training and scoring data with
+    :func:`PermutationImportance.data_verification.coerce_inputs`. Inputs
+    which are the same for both are only converted once
+
+    :param training_data: a verified 2-tuple ``(inputs, outputs)``
+    :param scoring_data: a verified 2-tuple ``(inputs, outputs)``
+    :param dtype: the dtype for the inputs. If None, the dtype is unchanged
+    :param order: the memory layout of numpy inputs, either "C" or "F"
+    :param read_only: whether to replace numpy arrays with read-only views of
+        them, so that the ``scoring_fn`` cannot modify the data. Defaults to 
+        False
+    :returns: (training_data, scoring_data)
+    """
+    coerced_training_data = coerce_inputs(training_data, dtype, order)
+    if scoring_data[0] is training_data[0]:
+        coerced_scoring_data = (coerced_training_data[0], scoring_data[1])
+    else:
+        coerced_scoring_data = coerce_inputs(scoring_data, dtype, order)
+    if not read_only:
+        return coerced_training_data, coerced_scoring_data
+
+    # Arrays which are the same for both should still be the same afterwards
+    views = dict()
+    for data in coerced_training_data + coerced_scoring_data:
+        if isinstance(data, np.ndarray) and id(data) not in views:
+            views[id(data)] = data.view()
+            views[id(data)].flags.writeable = False
+    return tuple(tuple(views.get(id(data), data) for data in dataset) for dataset in (coerced_training_data, coerced_scoring_data))
+
+
+def _singlethread_iteration(selection_iterator, scoring_fn, prefetch=False):
     """Handles a single pass of the abstract variable importance algorithm, 
     assuming a single worker thread
 
@@ -95,28 +179,142 @@ def _singlethread_iteration(selection_iterator, scoring_fn):
         :class:`PermutationImportance.selection_strategies.SelectionStrategy`
     :param scoring_fn: a function to be used for scoring. Should be of the form
         ``(training_data, scoring_data) -> float``
+    :param prefetch: whether to prepare the datasets for the next variable in 
+        the background while the current variable is scored. Only safe if the
+        iterator yields fresh datasets and does not share random state with
+        the ``scoring_fn``. Defaults to False
     :returns: a dict of ``{var: score}``
     """
     result = dict()
-    for var, training_data, scoring_data in selection_iterator:
-        score = scoring_fn(training_data, scoring_data)
-        result[var] = score
+    if not prefetch:
+        for var, training_data, scoring_data in selection_iterator:
+            score = scoring_fn(training_data, scoring_data)
+            result[var] = score
+        return result
+
+    selection_iterator = iter(selection_iterator)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_triple = executor.submit(next, selection_iterator, None)
+        while True:
+            triple = next_triple.result()
+            if triple is None:
+                break
+            next_triple = executor.submit(next, selection_iterator, None)
+            var, training_data, scoring_data = triple
+            score = scoring_fn(training_data, scoring_data)
+            result[var] = score
     return result
 
 
-def _multithread_iteration(selection_iterator, scoring_fn, njobs):
+def _batched_iteration(selection_iterator, batched_scoring_fn):
+    """Handles a single pass of the abstract variable importance algorithm by
+    scoring all variables at once
+
+    :param selection_iterator: a 
+        :class:`PermutationImportance.selection_strategies.ColumnSelectionStrategy`
+    :param batched_scoring_fn: a function to be used for scoring all variables 
+        at once. Should be of the form
+        ``(training_data, scoring_data, [columns]) -> [float]``
+    :returns: a dict of ``{var: score}``
+    """
+    if not isinstance(selection_iterator, ColumnSelectionStrategy):
+        raise InvalidInputException(
+            selection_iterator, "Batched scoring requires a ColumnSelectionStrategy")
+    variables, columns = zip(*selection_iterator.generate_all_columns())
+    scores = batched_scoring_fn(
+        selection_iterator.training_data, selection_iterator.scoring_data, list(columns))
+    if len(scores) != len(variables):
+        raise InvalidInputException(
+            scores, "Batched scoring function should return %i scores" % len(variables))
+    return dict(zip(variables, scores))
+
+
+def _multithread_iteration(selection_iterator, scoring_fn, njobs, chunksize=1, pool=None):
     """Handles a single pass of the abstract variable importance algorithm using
     multithreading
 
     :param selection_iterator: an iterator which yields triples
         ``(variable, training_data, scoring_data)``. Typically a 
-        :class:`PermutationImportance.selection_strategies.SelectionStrategy`
+        :class:`PermutationImportance.selection_strategies.SelectionStrategy`.
+        If a :class:`PermutationImportance.selection_strategies.ColumnSelectionStrategy`,
+        only the columns for each variable are sent to the processes
     :param scoring_fn: a function to be used for scoring. Should be of the form
         ``(training_data, scoring_data) -> float``
-    :param num_jobs: number of processes to use
+    :param njobs: number of processes to use
+    :param chunksize: number of triples to send to a process at once.
+        Defaults to 1
+    :param pool: an optional pool from ``_make_worker_pool`` to reuse. If not
+        given, a pool is created for just this pass
     :returns: a dict of ``{var: score}``
     """
+    if pool is None:
+        with _make_worker_pool(selection_iterator, scoring_fn, njobs) as pool:
+            return _multithread_iteration(selection_iterator, scoring_fn, njobs, chunksize, pool)
+
+    if isinstance(selection_iterator, ColumnSelectionStrategy):
+        selection_iterator = selection_iterator.generate_all_columns()
     result = dict()
-    for index, score in pool_imap_unordered(scoring_fn, selection_iterator, njobs):
+    for index, score in pool.imap_unordered(selection_iterator, chunksize):
         result[index] = score
     return result
+
+
+def _make_worker_pool(selection_iterator, scoring_fn, njobs):
+    """Creates a pool of processes for scoring the variables of a selection
+    iterator. The same pool can be used for every pass of the algorithm
+
+    :param selection_iterator: the selection iterator of the first pass
+    :param scoring_fn: a function to be used for scoring. Should be of the form
+        ``(training_data, scoring_data) -> float``
+    :param njobs: number of processes to use
+    :returns: a :class:`PermutationImportance.multiprocessing_utils.WorkerPool`
+    """
+    if not isinstance(selection_iterator, ColumnSelectionStrategy):
+        return WorkerPool(scoring_fn, njobs)
+
+    # Each process holds onto the data, so we only need to send columns. The
+    # numpy arrays are placed in shared memory so they aren't copied. Arrays
+    # which are the same for training and scoring are only shared once
+    shared = dict()
+    for data in tuple(selection_iterator.training_data) + tuple(selection_iterator.scoring_data):
+        if id(data) not in shared:
+            shared[id(data)] = share_array(data)
+    training_data = tuple(shared[id(data)]
+                          for data in selection_iterator.training_data)
+    scoring_data = tuple(shared[id(data)]
+                         for data in selection_iterator.scoring_data)
+    shared_arrays = [data for data in shared.values()
+                     if isinstance(data, SharedArray)]
+    return WorkerPool(_column_subset_scorer(scoring_fn, training_data, scoring_data), njobs, shared_arrays=shared_arrays)
+
+
+class _column_subset_scorer(object):
+    """Wraps a ``scoring_fn`` so that it can be called with only the columns of
+    the data to be used. This allows the data to be sent to each process only
+    once, rather than once for each variable"""
+
+    def __init__(self, scoring_fn, training_data, scoring_data):
+        """Stores the scoring function and the complete datasets
+
+        :param scoring_fn: a function to be used for scoring. Should be of the
+            form ``(training_data, scoring_data) -> float``
+        :param training_data: (training_inputs, training_outputs), either of
+            which may be a :class:`PermutationImportance.multiprocessing_utils.SharedArray`
+        :param scoring_data: (scoring_inputs, scoring_outputs), either of which
+            may be a :class:`PermutationImportance.multiprocessing_utils.SharedArray`
+        """
+        self.scoring_fn = scoring_fn
+        self.training_data = training_data
+        self.scoring_data = scoring_data
+
+    def __call__(self, columns):
+        """Scores the subset of the data with the given columns
+
+        :param columns: a list of column indices
+        :returns: the score of the subset of the data
+        """
+        training_inputs, training_outputs = [
+            unshare_array(data) for data in self.training_data]
+        scoring_inputs, scoring_outputs = [
+            unshare_array(data) for data in self.scoring_data]
+        return self.scoring_fn((get_data_subset(training_inputs, None, columns), training_outputs), (get_data_subset(scoring_inputs, None, columns), scoring_outputs))
@@ -8,12 +8,7 @@ import pandas as pd
 
 from .error_handling import InvalidDataException, InvalidInputException
 
-try:
-    basestring
-except NameError:  # Python3
-    basestring = str
-
-__all__ = ["verify_data", "determine_variable_names"]
+__all__ = ["verify_data", "coerce_inputs", "determine_variable_names"]
 
 
 def verify_data(data):
@@ -38,7 +33,7 @@ def verify_data(data):
             # check if the first element is pandas dataframe or numpy array
             if isinstance(data[0], pd.DataFrame):
                 # check if the second element is string or pandas dataframe
-                if isinstance(data[1], basestring):
+                if isinstance(data[1], str):
                     return data[0].loc[:, data[0].columns != data[1]], data[0][[data[1]]]
                 elif isinstance(data[1], pd.DataFrame):
                     return data[0], data[1]
@@ -57,6 +52,30 @@ def verify_data(data):
                     data, "First element of data must be a numpy array or pandas dataframe")
 
 
+def coerce_inputs(data, dtype=None, order=None):
+    """Converts the inputs of a verified data tuple to the given dtype and/or
+    memory layout. Numpy inputs are also made contiguous, so that slices of them
+    do not need to be converted again by the ``scoring_fn`` (as is typical of 
+    sklearn models)
+
+    :param data: (numpy array for input, numpy array for output) or 
+        (pandas dataframe for input, pandas dataframe for output)
+    :param dtype: the dtype for the inputs (e.g. ``np.float32``). If None, the
+        dtype is unchanged
+    :param order: the memory layout of numpy inputs, either "C" (row-major) or
+        "F" (column-major). If None, defaults to "C" when converting the dtype
+        and otherwise leaves the layout unchanged. Ignored for pandas inputs
+    :returns: (inputs, outputs) with converted inputs
+    """
+    if dtype is None and order is None:
+        return data
+    inputs, outputs = data
+    if isinstance(inputs, pd.DataFrame):
+        return (inputs if dtype is None else inputs.astype(dtype)), outputs
+    else:
+        return np.asarray(inputs, dtype=dtype, order="C" if order is None else order), outputs
+
+
 def determine_variable_names(data, variable_names):
     """Uses ``data`` and/or the ``variable_names`` to determine what the 
     variable names are. If ``variable_names`` is not specified and ``data`` is 
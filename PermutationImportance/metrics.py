@@ -77,11 +77,11 @@ def _get_contingency_table(truths, predictions, classes=None):
         if len(predictions.shape) != 2 or predictions.shape[1] != truths.shape[1]:
             raise UnmatchingProbabilisticForecastsException(
                 truths, predictions)
-        table = np.zeros((truths.shape[1], truths.shape[1]), dtype=np.float32)
+        num_classes = truths.shape[1]
         trues = np.argmax(truths, axis=1)
         preds = np.argmax(predictions, axis=1)
-        for true, pred in zip(trues, preds):
-            table[pred, true] += 1
+        table = np.bincount(preds * num_classes + trues, minlength=num_classes **
+                            2).reshape((num_classes, num_classes)).astype(np.float32)
     else:
         if len(predictions.shape) == 2:
             # in this case, we require the class listing
@@ -94,14 +94,94 @@ def _get_contingency_table(truths, predictions, classes=None):
         # Truths and predictions are now both deterministic
         if classes is None:
             classes = np.unique(np.append(np.unique(truths), np.unique(preds)))
-        table = np.zeros((len(classes), len(classes)), dtype=np.float32)
-        for i, c1 in enumerate(classes):
-            for j, c2 in enumerate(classes):
-                table[i, j] = [p == c1 and t == c2 for p,
-                               t in zip(preds, truths)].count(True)
+        class_ids, (pred_idx, pred_found), (true_idx, true_found) = _class_indices(
+            classes, preds, truths)
+        num_classes = max(class_ids) + 1 if len(class_ids) > 0 else 0
+        # Pairs involving a value outside of the classes are not counted
+        valid = pred_found & true_found
+        table = np.bincount(pred_idx[valid] * num_classes + true_idx[valid], minlength=num_classes **
+                            2).reshape((num_classes, num_classes))
+        # Repeated classes each receive the counts of that class
+        table = table[np.ix_(class_ids, class_ids)].astype(np.float32)
     return table
 
 
+def _class_indices(classes, *labels):
+    """Finds the index of each of the labels among the unique classes. Labels
+    and classes are compared with ``==``, so labels of a different type than
+    the classes never match
+
+    :param classes: an ordered set for the label possibilities. May contain
+        repeated or mixed types of classes
+    :param labels: any number of 1D arrays of labels
+    :returns: ``class_ids``, the index of the unique class for each of the 
+        classes, followed by a pair ``(indices, found)`` for each of the 
+        labels, where ``indices`` is the index of the unique class of each 
+        label and ``found`` is a mask of which labels are among the classes
+    """
+    class_array = np.asarray(classes)
+    labels = [np.asarray(label) for label in labels]
+    if _are_sortable(classes, class_array, labels):
+        unique_classes, class_ids = np.unique(class_array, return_inverse=True)
+        return (class_ids.ravel(),) + tuple(_sorted_class_indices(label, unique_classes) for label in labels)
+
+    # Otherwise, compare every label with every class
+    unique_classes = list()
+    class_ids = list()
+    for cls in classes:
+        matches = [k for k, unique_class in enumerate(
+            unique_classes) if bool(unique_class == cls)]
+        if len(matches) == 0:
+            matches = [len(unique_classes)]
+            unique_classes.append(cls)
+        class_ids.append(matches[0])
+    results = [np.array(class_ids, dtype=int)]
+    for label in labels:
+        label = label.astype(object)
+        indices = np.zeros(len(label), dtype=int)
+        found = np.zeros(len(label), dtype=bool)
+        for k, unique_class in enumerate(unique_classes):
+            matches = ~found & np.array(
+                [bool(value == unique_class) for value in label], dtype=bool)
+            indices[matches] = k
+            found |= matches
+        results.append((indices, found))
+    return tuple(results)
+
+
+def _are_sortable(classes, class_array, labels):
+    """Determines whether the classes and labels can be compared by sorting,
+    which is only the case if all are numbers or all are strings
+
+    :param classes: the original classes
+    :param class_array: the classes as a numpy array
+    :param labels: a list of arrays of labels
+    :returns: a boolean
+    """
+    for kinds in ["biuf", "U", "S"]:
+        if class_array.dtype.kind in kinds and all(label.dtype.kind in kinds for label in labels):
+            # Converting a list of mixed types to an array changes some values
+            return isinstance(classes, np.ndarray) or class_array.tolist() == list(classes)
+    return False
+
+
+def _sorted_class_indices(values, sorted_classes):
+    """Finds the index of each value in the sorted unique classes
+
+    :param values: a 1D array of labels
+    :param sorted_classes: a sorted 1D array of the unique label possibilities
+    :returns: a pair ``(indices, found)`` of integer indices into the classes
+        and a boolean mask of which values were found in the classes at all
+    """
+    if len(sorted_classes) == 0:
+        return np.zeros(len(values), dtype=int), np.zeros(len(values), dtype=bool)
+    # Values past the largest class are clipped and then fail the match
+    positions = np.minimum(np.searchsorted(
+        sorted_classes, values), len(sorted_classes) - 1)
+    found = sorted_classes[positions] == values
+    return positions, found
+
+
 def _peirce_skill_score(table):
     """This function is borrowed with modification from the hagelslag repository
     MulticlassContingencyTable class. It is used here with permission of
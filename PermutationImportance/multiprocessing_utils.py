@@ -1,82 +1,176 @@
 """These are utilities designed for carefully handling communication between
 processes while multithreading.
 
-The code for ``pool_imap_unordered`` is copied nearly wholesale from GrantJ's 
-`Stack Overflow answer here
-<https://stackoverflow.com/questions/5318936/python-multiprocessing-pool-lazy-iteration?noredirect=1&lq=1>`_.
-It allows for a lazy imap over an iterable and the return of very large objects
+``WorkerPool`` wraps a ``multiprocessing.Pool`` whose worker processes each
+have a function bound once by the pool's initializer, so only the items of an
+iterable are sent to the workers with each task. The same pool can be reused to
+map over many iterables. ``pool_imap_unordered`` lazily maps a function over a
+single iterable using a temporary ``WorkerPool``. Both stream the results back
+as they complete.
+
+``SharedArray`` copies a numpy array into shared memory (where available), so
+that it is sent to the worker processes by name rather than by value.
 """
 
-from multiprocessing import Process, Queue, cpu_count
+import multiprocessing as mp
+import numpy as np
 try:
-    from Queue import Full as QueueFull
-    from Queue import Empty as QueueEmpty
-except ImportError:  # python3
-    from queue import Full as QueueFull
-    from queue import Empty as QueueEmpty
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
 
-__all__ = ["pool_imap_unordered"]
+__all__ = ["pool_imap_unordered", "WorkerPool", "SharedArray",
+           "share_array", "unshare_array"]
 
 
-def worker(func, recvq, sendq):
-    for args in iter(recvq.get, None):
-        result = (args[0], func(*args[1:]))
-        sendq.put(result)
+# The function bound to the current worker process by ``_init_worker``
+_WORKER_FUNC = None
 
 
-def pool_imap_unordered(func, iterable, procs=cpu_count()):
-    """Lazily imaps in an unordered manner over an iterable in parallel as a 
-    generator
+def _init_worker(func):
+    """Binds the function to be mapped in a newly started worker process
 
-    :Author: Grant Jenks <https://stackoverflow.com/users/232571/grantj> 
+    :param func: function to perform on each item of the iterable
+    """
+    global _WORKER_FUNC
+    _WORKER_FUNC = func
+
+
+def _apply_worker_func(args):
+    """Applies the bound function to all but the first element of ``args``
+
+    :param args: a tuple ``(key, *func_args)``
+    :returns: ``(key, func(*func_args))``
+    """
+    return args[0], _WORKER_FUNC(*args[1:])
+
+
+class WorkerPool(object):
+    """A pool of worker processes which each have the same function bound, so
+    that the function (and anything it holds onto) is sent to each process
+    only once. Should be closed when no longer needed, either explicitly or by
+    using the pool as a context manager"""
+
+    def __init__(self, func, procs=mp.cpu_count(), shared_arrays=None):
+        """Starts the worker processes
+
+        :param func: function to perform on each item of the iterables
+        :param procs: number of workers in the pool. Defaults to the cpu count
+        :param shared_arrays: an optional list of :class:`SharedArray` used by 
+            func, which will be closed along with the pool
+        """
+        self.shared_arrays = list(
+            shared_arrays) if shared_arrays is not None else list()
+        self.pool = mp.Pool(procs, initializer=_init_worker, initargs=(func,))
+
+    def imap_unordered(self, iterable, chunksize=1):
+        """Lazily imaps the bound function in an unordered manner over an 
+        iterable. Each item of the iterable should be a tuple 
+        ``(key, *func_args)``
+
+        :param iterable: iterable which has items to map over
+        :param chunksize: number of items of the iterable to send to a worker
+            at once. Defaults to 1
+        :returns: an iterator of pairs ``(key, func(*func_args))``
+        """
+        return self.pool.imap_unordered(_apply_worker_func, iterable, chunksize)
+
+    def close(self):
+        """Stops the worker processes and frees any shared arrays"""
+        self.pool.terminate()
+        self.pool.join()
+        for shared_array in self.shared_arrays:
+            shared_array.close()
+        self.shared_arrays = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def pool_imap_unordered(func, iterable, procs=mp.cpu_count(), chunksize=1):
+    """Lazily imaps in an unordered manner over an iterable in parallel as a
+    generator. Each item of the iterable should be a tuple
+    ``(key, *func_args)``
 
     :param func: function to perform on each iterable
     :param iterable: iterable which has items to map over
     :param procs: number of workers in the pool. Defaults to the cpu count
-    :yields: the results of the mapping
+    :param chunksize: number of items of the iterable to send to a worker at
+        once. Defaults to 1
+    :yields: pairs of ``(key, func(*func_args))``
+    """
+    with WorkerPool(func, procs) as pool:
+        for result in pool.imap_unordered(iterable, chunksize):
+            yield result
+
+
+class SharedArray(object):
+    """Houses a copy of a numpy array in shared memory. When pickled (for
+    instance, to be sent to a worker process), only the name of the shared
+    memory block is sent and the receiving process attaches to the same block,
+    so that the data is never copied between processes. The array itself is
+    available as the ``array`` attribute, and is read-only if the original
+    array was"""
+
+    def __init__(self, array):
+        """Copies the array into a newly created block of shared memory
+
+        :param array: a numpy array
+        """
+        self.shape = array.shape
+        self.dtype = array.dtype
+        # Keep column-major arrays column-major
+        self.order = "F" if array.flags.f_contiguous and not array.flags.c_contiguous else "C"
+        # Shared memory blocks cannot be empty
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(
+            self.shape, self.dtype, buffer=self._shm.buf, order=self.order)
+        self.array[...] = array
+        self.array.flags.writeable = array.flags.writeable
+
+    def __getstate__(self):
+        return (self._shm.name, self.shape, self.dtype, self.order, self.array.flags.writeable)
+
+    def __setstate__(self, state):
+        name, self.shape, self.dtype, self.order, writeable = state
+        self._shm = shared_memory.SharedMemory(name=name)
+        self.array = np.ndarray(
+            self.shape, self.dtype, buffer=self._shm.buf, order=self.order)
+        self.array.flags.writeable = writeable
+
+    def close(self):
+        """Frees the shared memory block. Should only be called by the process
+        which created the block, once no other process needs it"""
+        # The array must be released before the memory can be closed
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+
+
+def share_array(data):
+    """Places the data in shared memory if it is a numpy array and shared
+    memory is available
+
+    :param data: either a pandas dataframe or a numpy array
+    :returns: a :class:`SharedArray` if possible, otherwise data
+    """
+    if shared_memory is not None and isinstance(data, np.ndarray) and data.dtype != object:
+        return SharedArray(data)
+    else:
+        return data
+
+
+def unshare_array(data):
+    """Retrieves the array from a :class:`SharedArray`
+
+    :param data: either a :class:`SharedArray` or any other data
+    :returns: the numpy array if data was shared, otherwise data
     """
-    # Create queues for sending/receiving items from iterable.
-
-    sendq = Queue(procs)
-    recvq = Queue()
-
-    # Start worker processes.
-
-    for rpt in range(procs):
-        Process(target=worker, args=(func, sendq, recvq)).start()
-
-    # Iterate iterable and communicate with worker processes.
-
-    send_len = 0
-    recv_len = 0
-    itr = iter(iterable)
-
-    try:
-        value = next(itr)
-        while True:
-            try:
-                sendq.put(value, True, 0.1)
-                send_len += 1
-                value = next(itr)
-            except QueueFull:
-                while True:
-                    try:
-                        result = recvq.get(False)
-                        recv_len += 1
-                        yield result
-                    except QueueEmpty:
-                        break
-    except StopIteration:
-        pass
-
-    # Collect all remaining results.
-
-    while recv_len < send_len:
-        result = recvq.get()
-        recv_len += 1
-        yield result
-
-    # Terminate worker processes.
-
-    for rpt in range(procs):
-        sendq.put(None)
+    if isinstance(data, SharedArray):
+        return data.array
+    else:
+        return data
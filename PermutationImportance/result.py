@@ -11,11 +11,6 @@ over the ``(context, results)`` pairs and for indexing into the list of pairs.
 
 import warnings
 
-try:
-    from itertools import izip as zip
-except ImportError:  # python3
-    pass
-
 from .error_handling import FullImportanceResultWarning
 
 
@@ -11,7 +11,11 @@ Below, ``SelectionStrategy`` encapsulates the base functionality which houses th
 parameters necessary to produce the generator as well as the default method for
 providing only the datasets which are necessary to be evaluated. Each of the
 other classes extends this base class to implement a particular variable 
-importance method.
+importance method. Strategies which only ever select a subset of the columns
+extend ``ColumnSelectionStrategy``, which can additionally provide just the
+columns for each variable. The inputs these provide may be read-only views of
+the original data rather than copies, so the scoring function should not modify
+them in place.
 
 If you wish to design your own variable importance method, you will want to
 extend the ``SelectionStrategy`` base class in the same way as the other 
@@ -28,6 +32,7 @@ from .utils import get_data_subset, make_data_from_columns
 __all__ = ["SequentialForwardSelectionStrategy",
            "SequentialBackwardSelectionStrategy",
            "PermutationImportanceSelectionStrategy",
+           "ColumnSelectionStrategy",
            "SelectionStrategy"]
 
 
@@ -58,36 +63,52 @@ class SelectionStrategy(object):
         raise NotImplementedError(
             "Please implement a strategy for generating datasets on class %s" % self.name)
 
+    def generate_candidates(self):
+        """Determines the variables which are not yet considered important
+
+        :returns: a list of variable indices
+        """
+        important_vars = set(self.important_vars)
+        return [var for var in range(self.num_vars) if var not in important_vars]
+
     def generate_all_datasets(self):
         """By default, loops over all variables not yet considered important"""
-        for var in range(self.num_vars):
-            if var not in self.important_vars:
-                training_data, scoring_data = self.generate_datasets(
-                    self.important_vars + [var, ])
-                yield (var, training_data, scoring_data)
+        for var in self.generate_candidates():
+            training_data, scoring_data = self.generate_datasets(
+                self.important_vars + [var, ])
+            yield (var, training_data, scoring_data)
 
     def __iter__(self):
         return self.generate_all_datasets()
 
 
-class SequentialForwardSelectionStrategy(SelectionStrategy):
-    """Sequential Forward Selection tests all variables which are not yet 
-    considered important by adding that columns to the other columns which are
-    returned. This means that the shape of the training data will be
-    ``(num_rows, num_important_vars + 1)``."""
+class ColumnSelectionStrategy(SelectionStrategy):
+    """The ``ColumnSelectionStrategy`` is the base for all strategies whose
+    datasets are simply a subset of the columns of the original data. Rather
+    than the datasets themselves, these strategies can also provide just the
+    columns for each variable via ``generate_all_columns``, which is much 
+    cheaper to send to other processes."""
 
-    name = "Sequential Forward Selection"
+    name = "Abstract Column Selection Strategy"
+
+    def generate_columns(self, important_variables):
+        """Determines the columns of the data to include
+
+        :returns: a list of column indices
+        """
+        raise NotImplementedError(
+            "Please implement a strategy for generating columns on class %s" % self.name)
 
     def generate_datasets(self, important_variables):
-        """Check each of the non-important variables. Dataset is the columns 
-        which are important
+        """Slices the data down to the columns for the important variables.
+        For numpy inputs, a contiguous range of columns is a read-only view
 
         :returns: (training_data, scoring_data)
         """
         training_inputs, training_outputs = self.training_data
         scoring_inputs, scoring_outputs = self.scoring_data
 
-        columns = important_variables
+        columns = self.generate_columns(important_variables)
         # Make a slice of the training inputs
         training_inputs_subset = get_data_subset(
             training_inputs, None, columns)
@@ -96,8 +117,31 @@ class SequentialForwardSelectionStrategy(SelectionStrategy):
             scoring_inputs, None, columns)
         return (training_inputs_subset, training_outputs), (scoring_inputs_subset, scoring_outputs)
 
+    def generate_all_columns(self):
+        """Generator which returns pairs (variable, columns) for all variables
+        not yet considered important"""
+        for var in self.generate_candidates():
+            yield (var, self.generate_columns(self.important_vars + [var, ]))
+
+
+class SequentialForwardSelectionStrategy(ColumnSelectionStrategy):
+    """Sequential Forward Selection tests all variables which are not yet 
+    considered important by adding that columns to the other columns which are
+    returned. This means that the shape of the training data will be
+    ``(num_rows, num_important_vars + 1)``."""
 
-class SequentialBackwardSelectionStrategy(SelectionStrategy):
+    name = "Sequential Forward Selection"
+
+    def generate_columns(self, important_variables):
+        """Check each of the non-important variables. Dataset is the columns 
+        which are important
+
+        :returns: a list of column indices
+        """
+        return important_variables
+
+
+class SequentialBackwardSelectionStrategy(ColumnSelectionStrategy):
     """Sequential Backward Selection tests all variables which are not yet 
     considered important by removing that column from the data. This means that
     the shape of the training data will be 
@@ -105,24 +149,15 @@ class SequentialBackwardSelectionStrategy(SelectionStrategy):
 
     name = "Sequential Backward Selection"
 
-    def generate_datasets(self, important_variables):
+    def generate_columns(self, important_variables):
         """Check each of the non-important variables. Dataset is the columns 
         which are not important
 
-        :yields: a sequence of (variable being evaluated, columns to include)
+        :returns: a list of column indices
         """
-        training_inputs, training_outputs = self.training_data
-        scoring_inputs, scoring_outputs = self.scoring_data
-
-        columns = [x for x in range(self.num_vars)
-                   if x not in important_variables]
-        # Make a slice of the training inputs
-        training_inputs_subset = get_data_subset(
-            training_inputs, None, columns)
-        # Make a slice of the scoring inputs
-        scoring_inputs_subset = get_data_subset(
-            scoring_inputs, None, columns)
-        return (training_inputs_subset, training_outputs), (scoring_inputs_subset, scoring_outputs)
+        important_variables = set(important_variables)
+        return [x for x in range(self.num_vars)
+                if x not in important_variables]
 
 
 class PermutationImportanceSelectionStrategy(SelectionStrategy):
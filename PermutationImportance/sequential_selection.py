@@ -32,7 +32,7 @@ __all__ = ["sequential_forward_selection",
            "sklearn_sequential_backward_selection"]
 
 
-def sequential_forward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1):
+def sequential_forward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1, batched_scoring_fn=None, dtype=None):
     """Performs sequential forward selection over data given a particular
     set of functions for scoring and determining optimal variables
 
@@ -51,13 +51,22 @@ def sequential_forward_selection(training_data, scoring_data, scoring_fn, scorin
         Defaults to all variables
     :param njobs: an integer for the number of threads to use. If negative, will
         use ``num_cpus + njobs``. Defaults to 1
+    :param batched_scoring_fn: an optional function for scoring all variables
+        at once. Should be of the form 
+        ``(training_data, scoring_data, [columns]) -> [some_value]``, where 
+        each ``columns`` is a list of the column indices to use and one value
+        is returned for each. If given, is used in place of ``scoring_fn`` for
+        each variable, so ``njobs`` must be 1
+    :param dtype: an optional dtype (e.g. ``np.float32``) to convert the inputs
+        of the data to once up front. Defaults to None, which leaves the data
+        unchanged
     :returns: :class:`PermutationImportance.result.ImportanceResult` object 
         which contains the results for each run
     """
-    return abstract_variable_importance(training_data, scoring_data, scoring_fn, scoring_strategy, SequentialForwardSelectionStrategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs)
+    return abstract_variable_importance(training_data, scoring_data, scoring_fn, scoring_strategy, SequentialForwardSelectionStrategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs, batched_scoring_fn=batched_scoring_fn, dtype=dtype)
 
 
-def sklearn_sequential_forward_selection(model, training_data, scoring_data, evaluation_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1, nbootstrap=None, subsample=1, **kwargs):
+def sklearn_sequential_forward_selection(model, training_data, scoring_data, evaluation_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1, nbootstrap=None, subsample=1, dtype=None, **kwargs):
     """Performs sequential forward selection for a particular model, 
     ``scoring_data``, ``evaluation_fn``, and strategy for determining optimal 
     variables
@@ -89,6 +98,9 @@ def sklearn_sequential_forward_selection(model, training_data, scoring_data, eva
         of total number of events (e.g. 0.5 means half the number of events).
         If not specified, subsampling will not be used and the entire data will
         be used (without replacement)
+    :param dtype: an optional dtype (e.g. ``np.float32``) to convert the inputs
+        of the data to once up front. Defaults to None, which leaves the data
+        unchanged
     :param kwargs: all other kwargs will be passed on to the ``evaluation_fn``
     :returns: :class:`PermutationImportance.result.ImportanceResult` object 
         which contains the results for each run
@@ -100,10 +112,10 @@ def sklearn_sequential_forward_selection(model, training_data, scoring_data, eva
     else:
         scoring_fn = score_untrained_sklearn_model(
             model, evaluation_fn, nbootstrap=nbootstrap, subsample=subsample, **kwargs)
-    return sequential_forward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs)
+    return sequential_forward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs, dtype=dtype)
 
 
-def sequential_backward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1):
+def sequential_backward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1, batched_scoring_fn=None, dtype=None):
     """Performs sequential backward selection over data given a particular
     set of functions for scoring and determining optimal variables
 
@@ -122,13 +134,22 @@ def sequential_backward_selection(training_data, scoring_data, scoring_fn, scori
         Defaults to all variables
     :param njobs: an integer for the number of threads to use. If negative, will
         use ``num_cpus + njobs``. Defaults to 1
+    :param batched_scoring_fn: an optional function for scoring all variables
+        at once. Should be of the form 
+        ``(training_data, scoring_data, [columns]) -> [some_value]``, where 
+        each ``columns`` is a list of the column indices to use and one value
+        is returned for each. If given, is used in place of ``scoring_fn`` for
+        each variable, so ``njobs`` must be 1
+    :param dtype: an optional dtype (e.g. ``np.float32``) to convert the inputs
+        of the data to once up front. Defaults to None, which leaves the data
+        unchanged
     :returns: :class:`PermutationImportance.result.ImportanceResult` object 
         which contains the results for each run
     """
-    return abstract_variable_importance(training_data, scoring_data, scoring_fn, scoring_strategy, SequentialBackwardSelectionStrategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs)
+    return abstract_variable_importance(training_data, scoring_data, scoring_fn, scoring_strategy, SequentialBackwardSelectionStrategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs, batched_scoring_fn=batched_scoring_fn, dtype=dtype)
 
 
-def sklearn_sequential_backward_selection(model, training_data, scoring_data, evaluation_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1, nbootstrap=None, subsample=1, **kwargs):
+def sklearn_sequential_backward_selection(model, training_data, scoring_data, evaluation_fn, scoring_strategy, variable_names=None, nimportant_vars=None, njobs=1, nbootstrap=None, subsample=1, dtype=None, **kwargs):
     """Performs sequential backward selection for a particular model, 
     ``scoring_data``, ``evaluation_fn``, and strategy for determining optimal 
     variables
@@ -160,6 +181,9 @@ def sklearn_sequential_backward_selection(model, training_data, scoring_data, ev
         of total number of events (e.g. 0.5 means half the number of events).
         If not specified, subsampling will not be used and the entire data will
         be used (without replacement)
+    :param dtype: an optional dtype (e.g. ``np.float32``) to convert the inputs
+        of the data to once up front. Defaults to None, which leaves the data
+        unchanged
     :param kwargs: all other kwargs will be passed on to the ``evaluation_fn``
     :returns: :class:`PermutationImportance.result.ImportanceResult` object 
         which contains the results for each run
@@ -171,4 +195,4 @@ def sklearn_sequential_backward_selection(model, training_data, scoring_data, ev
     else:
         scoring_fn = score_untrained_sklearn_model(
             model, evaluation_fn, nbootstrap=nbootstrap, subsample=subsample, **kwargs)
-    return sequential_backward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs)
+    return sequential_backward_selection(training_data, scoring_data, scoring_fn, scoring_strategy, variable_names=variable_names, nimportant_vars=nimportant_vars, njobs=njobs, dtype=dtype)
@@ -62,6 +62,8 @@ class model_scorer(object):
     given scoring data, and then evaluates those predictions using some 
     evaluation function. Additionally provides the tools for bootstrapping the
     scores and providing a distribution of scores to be used for statistics.
+    All bootstrap rounds reuse the predictions of a single trained model, so a
+    single call handles every bootstrap round for a variable.
     """
 
     def __init__(self, model, training_fn, prediction_fn, evaluation_fn, default_score=0.0, nbootstrap=None, subsample=1, **kwargs):
@@ -138,10 +140,13 @@ class model_scorer(object):
         if self.nbootstrap is None:
             return self.evaluation_fn(scoring_outputs, predictions, **self.kwargs)
         else:
-            # Bootstrap the scores
+            # Bootstrap the scores. The generator is seeded from numpy's global
+            # random state, so np.random.seed still makes results reproducible
+            rng = np.random.default_rng(
+                np.random.randint(2**32, dtype=np.uint64))
             scores = list()
             for _ in range(self.nbootstrap):
-                rows = np.random.choice(scoring_outputs.shape[0], subsample)
+                rows = rng.integers(0, scoring_outputs.shape[0], size=subsample)
 
                 subsampled_predictions = get_data_subset(predictions, rows)
                 subsampled_scoring_outputs = get_data_subset(
@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 
 from .error_handling import InvalidDataException
+from .scoring_strategies import indexer_of_converter
 
 __all__ = ["add_ranks_to_dict", "get_data_subset", "make_data_from_columns"]
 
@@ -21,42 +22,104 @@ def add_ranks_to_dict(result, variable_names, scoring_strategy):
     if len(result) == 0:
         return dict()
 
-    result_dict = dict()
-    rank = 0
-    while len(result) > 1:
-        var_idxs = list(result.keys())
-        idxs = np.argsort(var_idxs)
-        # Sort by indices to guarantee order
-        variables = list(np.array(var_idxs)[idxs])
-        scores = list(np.array(list(result.values()))[idxs])
-        best_var = variables[scoring_strategy(scores)]
-        score = result.pop(best_var)
-        result_dict[variable_names[best_var]] = (rank, score)
-        rank += 1
-    var, score = list(result.items())[0]
-    result_dict[variable_names[var]] = (rank, score)
-    return result_dict
+    # Sort by indices to guarantee order
+    variables = sorted(result.keys())
+    scores = [result[var] for var in variables]
+    order = _determine_rank_order(scores, scoring_strategy)
+    if order is None:
+        # Repeatedly apply the scoring strategy to the remaining scores
+        order = list()
+        remaining = list(range(len(scores)))
+        while len(remaining) > 1:
+            best = remaining.pop(scoring_strategy(
+                [scores[i] for i in remaining]))
+            order.append(best)
+        order.append(remaining[0])
+
+    return {variable_names[variables[idx]]: (rank, scores[idx]) for rank, idx in enumerate(order)}
+
+
+def _determine_rank_order(scores, scoring_strategy):
+    """Sorts the scores all at once if the scoring strategy is known to be an
+    argmin or argmax (possibly of some converter)
+
+    :param scores: a list of scores
+    :param scoring_strategy: a function to be used for determining optimal
+        variables. Should be of the form ([floats]) -> index
+    :returns: a list of the indices of the scores from best to worst, or None
+        if the scoring strategy is not recognized
+    """
+    converter = None
+    indexer = scoring_strategy
+    if isinstance(scoring_strategy, indexer_of_converter):
+        converter = scoring_strategy.converter
+        indexer = scoring_strategy.indexer
+    if indexer is not np.argmin and indexer is not np.argmax:
+        return None
+
+    values = _convert_scores(scores, converter)
+    if values.ndim != 1 or values.dtype.kind not in "biuf" or (values.dtype.kind == "f" and np.isnan(values).any()):
+        return None
+
+    if indexer is np.argmin:
+        return np.argsort(values, kind="stable").tolist()
+    else:
+        # Sort the reversed values so that ties go to the first occurrence
+        reversed_order = np.argsort(values[::-1], kind="stable")[::-1]
+        return (len(values) - 1 - reversed_order).tolist()
+
+
+def _convert_scores(scores, converter):
+    """Applies the converter to each of the scores. If the converter is
+    ``np.mean`` and all scores have the same shape, this is done in one call
+
+    :param scores: a list of scores
+    :param converter: a function which converts a single score to a simpler
+        value, or None to leave the scores as they are
+    :returns: a numpy array of the converted scores
+    """
+    if converter is np.mean:
+        try:
+            stacked = np.array(scores)
+        except ValueError:  # scores of different shapes
+            stacked = None
+        if stacked is not None and stacked.dtype != object:
+            return stacked.reshape((len(scores), -1)).mean(axis=1)
+    if converter is None:
+        return np.array(scores)
+    return np.array([converter(score) for score in scores])
 
 
 def get_data_subset(data, rows=None, columns=None):
     """Returns a subset of the data corresponding to the desired rows and
-    columns
+    columns. If a numpy array is subset only by a contiguous range of columns
+    (or not at all), the subset is a read-only view of the data rather than a
+    copy. Otherwise, the subset is a copy
 
     :param data: either a pandas dataframe or a numpy array
     :param rows: a list of row indices
     :param columns: a list of column indices
     :returns: data_subset (same type as data)
     """
-    if rows is None:
-        rows = np.arange(data.shape[0])
-
     if isinstance(data, pd.DataFrame):
+        if rows is None:
+            rows = np.arange(data.shape[0])
         if columns is None:
             return data.iloc[rows]
         else:
             return data.iloc[rows, columns]
     elif isinstance(data, np.ndarray):
-        if columns is None:
+        if rows is None:
+            if columns is None:
+                subset = data[:]
+            else:
+                columns = _contiguous_columns_to_slice(columns)
+                subset = data[:, columns]
+            if columns is None or isinstance(columns, slice):
+                # Views must not let the caller write into the original data
+                subset.flags.writeable = False
+            return subset
+        elif columns is None:
             return data[rows]
         else:
             return data[np.ix_(rows, columns)]
@@ -65,6 +128,19 @@ def get_data_subset(data, rows=None, columns=None):
             data, "Data must be a pandas dataframe or numpy array")
 
 
+def _contiguous_columns_to_slice(columns):
+    """Converts a list of column indices to a slice if they form a contiguous
+    increasing range, so that indexing with them gives a view
+
+    :param columns: a list of column indices
+    :returns: either a slice or the original columns
+    """
+    indices = np.asarray(columns)
+    if indices.ndim == 1 and len(indices) > 0 and indices.dtype.kind in "iu" and indices[0] >= 0 and (np.diff(indices) == 1).all():
+        return slice(int(indices[0]), int(indices[-1]) + 1)
+    return columns
+
+
 def make_data_from_columns(columns_list, index=None):
     """Synthesizes a dataset out of a list of columns
 
@@ -15,16 +15,15 @@ CLASSIFIERS = [
     'Development Status :: 4 - Beta',
     'Intended Audience :: Science/Research',
     'License :: OSI Approved :: MIT License',
-    'Programming Language :: Python :: 2.7',
     'Programming Language :: Python :: 3',
     'Operating System :: OS Independent',
     'Topic :: Scientific/Engineering :: Information Analysis']
 
-PACKAGE_REQUIREMENTS = ['numpy', 'pandas', 'scipy==1.1.0', 'scikit-learn']
+PACKAGE_REQUIREMENTS = ['numpy>=1.17', 'pandas', 'scipy==1.1.0', 'scikit-learn']
 
 if __name__ == '__main__':
     setup(name='PermutationImportance', version='1.2.1.8',
-          python_requires='>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*, !=3.5.*',
+          python_requires='>=3.6',
           description=SHORT_DESCRIPTION,
           author='G. Eli Jergensen', author_email='gelijergensen@ou.edu',
           long_description=long_description,
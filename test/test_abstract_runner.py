@@ -3,7 +3,9 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from PermutationImportance.abstract_runner import _singlethread_iteration, _multithread_iteration
+from PermutationImportance.abstract_runner import abstract_variable_importance, _coerce_datasets, _singlethread_iteration, _multithread_iteration, _batched_iteration, _make_worker_pool
+from PermutationImportance.error_handling import InvalidInputException
+from PermutationImportance.selection_strategies import SelectionStrategy, SequentialForwardSelectionStrategy, SequentialBackwardSelectionStrategy, PermutationImportanceSelectionStrategy
 
 
 def test__singlethread_iteration():
@@ -24,6 +26,46 @@ def test__singlethread_iteration():
                                                scoring_fn)
 
 
+class InPlaceZeroingStrategy(SelectionStrategy):
+    """Zeroes each column of a shared buffer only while it is being scored"""
+
+    name = "In Place Zeroing"
+
+    def generate_all_datasets(self):
+        inputs = self.scoring_data[0].copy()
+        for var in range(self.num_vars):
+            original = inputs[:, var].copy()
+            inputs[:, var] = 0
+            yield var, self.training_data, (inputs, self.scoring_data[1])
+            inputs[:, var] = original
+
+
+def test__singlethread_iteration_in_place_strategy():
+    scoring_data = (np.ones((4, 5)), np.ones((4, )))
+
+    def scoring_fn(training_data, scoring_data):
+        # Number of zeroed columns
+        return int((scoring_data[0] == 0).all(axis=0).sum())
+
+    result = abstract_variable_importance(
+        scoring_data, scoring_data, scoring_fn, "argmin", InPlaceZeroingStrategy, nimportant_vars=1)
+    assert {var: score for var, (rank, score) in result.retrieve_singlepass(
+    ).items()} == {var: 1 for var in range(5)}
+
+
+def test__singlethread_iteration_prefetch():
+    training_data = (np.random.rand(5, 3), np.random.rand(5, ))
+    scoring_data = (np.random.rand(5, 3), np.random.rand(5, ))
+
+    def scoring_fn(training_data, scoring_data):
+        return training_data[0].sum() + scoring_data[0].sum()
+
+    expected = _singlethread_iteration(SequentialForwardSelectionStrategy(
+        training_data, scoring_data, 3, [1]), scoring_fn)
+    assert expected == _singlethread_iteration(SequentialForwardSelectionStrategy(
+        training_data, scoring_data, 3, [1]), scoring_fn, prefetch=True)
+
+
 def test__multithread_iteration():
     A = [1, 2]
     B = [2, 4]
@@ -42,6 +84,129 @@ def test__multithread_iteration():
                                               scoring_fn, njobs=2)
 
 
+def test__multithread_iteration_columns():
+    training_data = (np.random.rand(5, 3), np.random.rand(5, ))
+    scoring_data = (np.random.rand(5, 3), np.random.rand(5, ))
+    strategy = SequentialForwardSelectionStrategy(
+        training_data, scoring_data, 3, [1])
+
+    def scoring_fn(training_data, scoring_data):
+        return training_data[0].sum() + scoring_data[0].sum()
+
+    expected = _singlethread_iteration(strategy, scoring_fn)
+    assert expected == _multithread_iteration(strategy, scoring_fn, njobs=2)
+
+    with _make_worker_pool(strategy, scoring_fn, 2) as pool:
+        for important_vars in [[1], [1, 0]]:
+            strategy = SequentialForwardSelectionStrategy(
+                training_data, scoring_data, 3, important_vars)
+            expected = _singlethread_iteration(strategy, scoring_fn)
+            assert expected == _multithread_iteration(
+                strategy, scoring_fn, 2, pool=pool)
+
+
+def test__batched_iteration():
+    training_data = (np.random.rand(5, 3), np.random.rand(5, ))
+    scoring_data = (np.random.rand(5, 3), np.random.rand(5, ))
+    strategy = SequentialForwardSelectionStrategy(
+        training_data, scoring_data, 3, [1])
+
+    def batched_scoring_fn(training_data, scoring_data, columns_list):
+        return [sum(columns) for columns in columns_list]
+
+    expected = {0: 1, 2: 3}
+    assert expected == _batched_iteration(strategy, batched_scoring_fn)
+
+    with pytest.raises(InvalidInputException):
+        _batched_iteration(strategy, lambda *args: [0])
+
+    strategy = PermutationImportanceSelectionStrategy(
+        training_data, scoring_data, 3, [1])
+    with pytest.raises(InvalidInputException):
+        _batched_iteration(strategy, batched_scoring_fn)
+
+
+def test_abstract_variable_importance_batched_validation():
+    training_data = (np.random.rand(5, 3), np.random.rand(5, ))
+    scoring_data = (np.random.rand(5, 3), np.random.rand(5, ))
+    calls = list()
+
+    def scoring_fn(training_data, scoring_data):
+        calls.append(None)
+        return 0
+
+    def batched_scoring_fn(training_data, scoring_data, columns_list):
+        return [0 for columns in columns_list]
+
+    # Both are rejected before the original score is computed
+    with pytest.raises(InvalidInputException):
+        abstract_variable_importance(training_data, scoring_data, scoring_fn, "argmin",
+                                     PermutationImportanceSelectionStrategy, batched_scoring_fn=batched_scoring_fn)
+    with pytest.raises(InvalidInputException):
+        abstract_variable_importance(training_data, scoring_data, scoring_fn, "argmin",
+                                     SequentialForwardSelectionStrategy, njobs=2, batched_scoring_fn=batched_scoring_fn)
+    assert len(calls) == 0
+
+
+def test__coerce_datasets():
+    inputs = np.random.rand(5, 3)
+    outputs = np.random.rand(5, )
+    training_data, scoring_data = _coerce_datasets(
+        (inputs, outputs), (inputs, outputs), order="F", read_only=True)
+    # Data which is the same for both is only converted once
+    assert training_data[0] is scoring_data[0]
+    assert training_data[1] is scoring_data[1]
+    assert training_data[0].flags['F_CONTIGUOUS']
+    assert not training_data[0].flags.writeable
+    assert not training_data[1].flags.writeable
+    assert (inputs == training_data[0]).all()
+    # The original data is left as is
+    assert inputs.flags.writeable and outputs.flags.writeable
+
+    other_inputs = np.random.rand(5, 3)
+    training_data, scoring_data = _coerce_datasets(
+        (inputs, outputs), (other_inputs, outputs))
+    assert training_data[0] is inputs
+    assert scoring_data[0] is other_inputs
+
+
+def _in_place_scoring_fn(training_data, scoring_data):
+    # Like sklearn models with copy_X=False, modifies the inputs in place unless
+    # they are read-only
+    inputs = training_data[0]
+    if not inputs.flags.writeable:
+        inputs = inputs.copy()
+    inputs *= 2
+    return float(np.abs(inputs - scoring_data[0]).sum())
+
+
+def _copying_scoring_fn(training_data, scoring_data):
+    return _in_place_scoring_fn((training_data[0].copy(), training_data[1]), scoring_data)
+
+
+def test_abstract_variable_importance_in_place_scoring_fn():
+    inputs = np.random.rand(20, 4)
+    original_inputs = inputs.copy()
+    data = (inputs, np.random.rand(20))
+
+    for strategy in [SequentialForwardSelectionStrategy, SequentialBackwardSelectionStrategy]:
+        expected = abstract_variable_importance(
+            data, data, _copying_scoring_fn, "argmin", strategy, nimportant_vars=2)
+        for njobs in [1, 2]:
+            # Scoring one variable must not affect the data for any other
+            result = abstract_variable_importance(
+                data, data, _in_place_scoring_fn, "argmin", strategy, nimportant_vars=2, njobs=njobs)
+            assert np.isclose(expected.original_score, result.original_score)
+            # Compare both the contexts and the results of each pass
+            for expected_dict, result_dict in zip(sum(expected, ()), sum(result, ())):
+                assert expected_dict.keys() == result_dict.keys()
+                for var, (rank, score) in expected_dict.items():
+                    assert rank == result_dict[var][0]
+                    assert np.isclose(score, result_dict[var][1])
+    assert (original_inputs == inputs).all()
+    assert inputs.flags.writeable
+
+
 # needs to run in 20 seconds or it probably hung in pool.join()
 @pytest.mark.timeout(20)
 def test__multithread_deadlock():
@@ -3,7 +3,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from PermutationImportance.data_verification import verify_data, determine_variable_names
+from PermutationImportance.data_verification import verify_data, coerce_inputs, determine_variable_names
 from PermutationImportance.error_handling import InvalidDataException, InvalidInputException
 
 
@@ -65,6 +65,32 @@ def test_pandas_dataframes():
         verify_data(data)
 
 
+def test_coerce_inputs():
+    inputs = np.asfortranarray(np.array([[1, 2, 3], [2, 4, 6]]))
+    outputs = np.array([1, 0])
+    data = (inputs, outputs)
+    assert coerce_inputs(data) is data
+
+    result = coerce_inputs(data, np.float32)
+    assert result[0].dtype == np.float32
+    assert result[0].flags['C_CONTIGUOUS']
+    assert (inputs == result[0]).all()
+    assert result[1] is outputs
+
+    result = coerce_inputs((result[0], outputs), order="F")
+    assert result[0].dtype == np.float32
+    assert result[0].flags['F_CONTIGUOUS']
+    assert (inputs == result[0]).all()
+
+    inputs = pd.DataFrame({'A': [1, 2], 'B': [2, 4]})
+    outputs = pd.DataFrame({'D': [1, 0]})
+    result = coerce_inputs((inputs, outputs), np.float32)
+    assert (result[0].dtypes == np.float32).all()
+    assert inputs.equals(result[0].astype(inputs.dtypes))
+    assert result[1] is outputs
+    assert coerce_inputs((inputs, outputs), order="F")[0] is inputs
+
+
 def test_variable_names():
     inputs = np.array([[1, 2, 3], [2, 4, 6]])
     outputs = np.array([1, 0])
@@ -21,6 +21,29 @@ def test__get_contingency_table():
     assert (expected == _get_contingency_table(
         truths, predictions, classes)).all()
 
+    # Classes need not be sorted, and labels outside of them are not counted
+    classes = ["c", "a"]
+    expected = np.array([[1, 0], [0, 3]])
+    assert (expected == _get_contingency_table(
+        truths, predictions, classes)).all()
+
+    # Repeated classes each receive the counts of that class
+    classes = ["a", "a", "b", "c"]
+    expected = np.array([[3, 3, 0, 0], [3, 3, 0, 0], [
+                        0, 0, 2, 2], [0, 0, 1, 1]])
+    assert (expected == _get_contingency_table(
+        truths, predictions, classes)).all()
+
+    # Classes of mixed types are only equal to labels of the same type
+    classes = ["x", 1, 2]
+    expected = np.array([[0, 0, 0], [0, 2, 0], [0, 0, 1]])
+    assert (expected == _get_contingency_table(
+        np.array([1, 1, 2]), np.array([1, 1, 2]), classes)).all()
+    classes = ["a", 1]
+    expected = np.array([[3, 0], [0, 0]])
+    assert (expected == _get_contingency_table(
+        truths, predictions, classes)).all()
+
     classes = ["a", "b", "c"]
     predictions = np.array([[1, 0, 0], [0, 0.9, 0.1], [0.05, 0.05, 0.9], [1, 0, 0], [0.05, 0.05, 0.9], [
                            0, 0.9, 0.1], [1, 0, 0], [0, 0.9, 0.1], [0, 0.9, 0.1]])
@@ -0,0 +1,103 @@
+
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from PermutationImportance import multiprocessing_utils
+from PermutationImportance.multiprocessing_utils import pool_imap_unordered, WorkerPool, SharedArray, share_array, unshare_array
+
+
+def _add(x, y):
+    return x + y
+
+
+def test_pool_imap_unordered():
+    iterable = [(i, i, 2 * i) for i in range(20)]
+
+    expected = {i: 3 * i for i in range(20)}
+    assert expected == dict(pool_imap_unordered(_add, iterable, 2))
+    assert expected == dict(pool_imap_unordered(_add, iterable, 2, 4))
+
+
+def test_worker_pool():
+    shared_arrays = list()
+    if multiprocessing_utils.shared_memory is not None:
+        shared_arrays.append(SharedArray(np.random.rand(5, 3)))
+    with WorkerPool(_add, 2, shared_arrays=shared_arrays) as pool:
+        # The same pool can be used many times
+        for offset in range(3):
+            iterable = [(i, i, offset) for i in range(10)]
+            expected = {i: i + offset for i in range(10)}
+            assert expected == dict(pool.imap_unordered(iterable, 2))
+    # The pool frees its shared arrays when closed
+    for shared in shared_arrays:
+        assert shared.array is None
+
+
+def _slow_identity(x, delay):
+    time.sleep(delay)
+    return x
+
+
+def test_pool_imap_unordered_collects_all():
+    # Tasks finish out of order, but no result may be dropped
+    delays = np.random.uniform(0, 0.01, size=200)
+    iterable = ((i, i, delay) for i, delay in enumerate(delays))
+
+    results = list(pool_imap_unordered(_slow_identity, iterable, 4, 3))
+    assert len(results) == len(delays)
+    assert {i: i for i in range(len(delays))} == dict(results)
+
+
+@pytest.mark.skipif(multiprocessing_utils.shared_memory is None,
+                    reason="shared memory requires python 3.8+")
+def test_shared_array():
+    data = np.random.rand(5, 3)
+    shared = SharedArray(data)
+    try:
+        assert (data == shared.array).all()
+
+        unpickled = pickle.loads(pickle.dumps(shared))
+        assert (data == unpickled.array).all()
+        # Both objects view the same memory
+        shared.array[0, 0] = -1
+        assert unpickled.array[0, 0] == -1
+        unpickled.array = None
+        unpickled._shm.close()
+    finally:
+        shared.close()
+
+    data = np.asfortranarray(np.random.rand(5, 3))
+    data.flags.writeable = False
+    shared = SharedArray(data)
+    try:
+        unpickled = pickle.loads(pickle.dumps(shared))
+        assert unpickled.array.flags['F_CONTIGUOUS']
+        assert not shared.array.flags.writeable
+        assert not unpickled.array.flags.writeable
+        assert (data == unpickled.array).all()
+        unpickled.array = None
+        unpickled._shm.close()
+    finally:
+        shared.close()
+
+
+@pytest.mark.skipif(multiprocessing_utils.shared_memory is None,
+                    reason="shared memory requires python 3.8+")
+def test_share_array():
+    data = np.random.rand(5, 3)
+    shared = share_array(data)
+    try:
+        assert isinstance(shared, SharedArray)
+        assert (data == unshare_array(shared)).all()
+    finally:
+        shared.close()
+
+
+def test_share_array_passthrough():
+    data = pd.DataFrame({'A': [1, 2], 'B': [2, 4]})
+    assert share_array(data) is data
+    assert unshare_array(data) is data
@@ -2,7 +2,7 @@
 import numpy as np
 import pytest
 
-from PermutationImportance.selection_strategies import SequentialForwardSelectionStrategy, SequentialBackwardSelectionStrategy, SelectionStrategy, PermutationImportanceSelectionStrategy
+from PermutationImportance.selection_strategies import SequentialForwardSelectionStrategy, SequentialBackwardSelectionStrategy, SelectionStrategy, ColumnSelectionStrategy, PermutationImportanceSelectionStrategy
 
 
 def test_selection_strategy():
@@ -11,10 +11,25 @@ def test_selection_strategy():
 
     assert getattr(strategy, "name") == "Abstract Selection Strategy"
 
+    strategy = SelectionStrategy((x, x), (x, x), 5, [3, 1])
+    assert [0, 2, 4] == strategy.generate_candidates()
+
     with pytest.raises(NotImplementedError):
         next(iter(strategy))
 
 
+def test_column_selection_strategy():
+    x = np.array([])
+    strategy = ColumnSelectionStrategy((x, x), (x, x), 1, [])
+
+    assert getattr(strategy, "name") == "Abstract Column Selection Strategy"
+
+    with pytest.raises(NotImplementedError):
+        next(iter(strategy))
+    with pytest.raises(NotImplementedError):
+        next(strategy.generate_all_columns())
+
+
 def test_sfs_strategy():
 
     training_data = (np.random.rand(5, 3), np.random.rand(5, ))
@@ -37,6 +52,9 @@ def test_sfs_strategy():
         assert (exp_score_data[0] == res_score_data[0]).all()
         assert (exp_score_data[1] == res_score_data[1]).all()
 
+    expected = [(0, [1, 0]), (2, [1, 2])]
+    assert expected == list(strategy.generate_all_columns())
+
 
 def test_sbs_strategy():
 
@@ -60,6 +78,9 @@ def test_sbs_strategy():
         assert (exp_score_data[0] == res_score_data[0]).all()
         assert (exp_score_data[1] == res_score_data[1]).all()
 
+    expected = [(0, [2]), (2, [0])]
+    assert expected == list(strategy.generate_all_columns())
+
 
 def test_permutation_strategy():
 
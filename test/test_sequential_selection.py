@@ -80,3 +80,37 @@ def test_sequential_backward_selection():
     for (exp_context, exp_result), (true_context, true_result) in zip(expected, result):
         assert exp_context == true_context
         assert exp_result == true_result
+
+
+def test_sequential_forward_selection_batched():
+    A = [1, 2]
+    B = [2, 4]
+    C = [3, 6]
+    D = [1, 0]
+    inputs = pd.DataFrame({'A': A, 'B': B, 'C': C})
+    outputs = pd.DataFrame({'D': D})
+
+    training_data = (inputs, outputs)
+    scoring_data = (inputs, outputs)
+
+    def scoring_fn(training_data, scoring_data):
+        if len(training_data[0].columns) == 0:
+            return 0
+        if 'A' in training_data[0].columns:
+            return scoring_data[0].iloc[1, -1]
+        else:
+            return scoring_data[0].iloc[1, -1] / 2
+
+    def batched_scoring_fn(training_data, scoring_data, columns_list):
+        return [scoring_fn((training_data[0].iloc[:, columns], training_data[1]), (scoring_data[0].iloc[:, columns], scoring_data[1])) for columns in columns_list]
+
+    expected = sequential_forward_selection(
+        training_data, scoring_data, scoring_fn, "argmin")
+    result = sequential_forward_selection(
+        training_data, scoring_data, scoring_fn, "argmin", batched_scoring_fn=batched_scoring_fn)
+
+    assert expected.retrieve_singlepass() == result.retrieve_singlepass()
+    assert expected.retrieve_multipass() == result.retrieve_multipass()
+    for (exp_context, exp_result), (true_context, true_result) in zip(expected, result):
+        assert exp_context == true_context
+        assert exp_result == true_result
@@ -70,6 +70,43 @@ def test_model_scorer():
     assert (score_fn.default_score == score2).all()
 
 
+def test_model_scorer_bootstrap_reproducible():
+
+    training_data, scoring_data = make_test_data()
+    model = SVC(gamma='auto')
+
+    score_fn = model_scorer(model, train_model, predict_model,
+                            accuracy_score, nbootstrap=5, subsample=0.2)
+
+    np.random.seed(0)
+    score = score_fn(training_data, scoring_data)
+    np.random.seed(0)
+    score2 = score_fn(training_data, scoring_data)
+
+    assert score.shape == (5,)
+    assert (score == score2).all()
+
+
+def test_model_scorer_bootstrap_mixed_types():
+
+    training_data, scoring_data = make_test_data()
+    model = SVC(gamma='auto')
+
+    # The first score is an int and the rest are floats
+    calls = list()
+
+    def evaluation_fn(truths, predictions):
+        calls.append(None)
+        return 1 if len(calls) == 1 else 0.667
+
+    score_fn = model_scorer(model, train_model, predict_model,
+                            evaluation_fn, nbootstrap=3, subsample=0.2)
+    score = score_fn(training_data, scoring_data)
+
+    assert score.dtype == np.float64
+    assert [1, 0.667, 0.667] == list(score)
+
+
 def test_score_sklearn_models():
     model = SVC(gamma='auto', probability=True)
 
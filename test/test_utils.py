@@ -4,6 +4,7 @@ import pandas as pd
 import pytest
 
 from PermutationImportance.error_handling import InvalidDataException
+from PermutationImportance.scoring_strategies import argmin_of_mean, argmax_of_mean
 from PermutationImportance.utils import add_ranks_to_dict, get_data_subset, make_data_from_columns
 
 
@@ -19,6 +20,35 @@ def test_add_ranks_to_dict():
     assert expected == add_ranks_to_dict(
         result, variable_names, scoring_strategy)
 
+    # Ties are broken by the variable index
+    result = {10: 0.5, 9: 0.6, 4: 0.5}
+    expected = {
+        9: (0, 0.6),
+        4: (1, 0.5),
+        10: (2, 0.5),
+    }
+    assert expected == add_ranks_to_dict(result, variable_names, np.argmax)
+
+    result = {10: np.array([0.25, 0.75]), 9: np.array(
+        [0.5, 0.0]), 4: np.array([0.5, 0.5])}
+    expected = {
+        4: (0, 0.5),
+        10: (1, 0.5),
+        9: (2, 0.25),
+    }
+    for strategy in [argmax_of_mean, lambda scores: np.argmax(
+            [np.mean(score) for score in scores])]:
+        ranks = add_ranks_to_dict(result, variable_names, strategy)
+        assert expected == {var: (rank, np.mean(score))
+                            for var, (rank, score) in ranks.items()}
+    ranks = add_ranks_to_dict(result, variable_names, argmin_of_mean)
+    assert [9, 4, 10] == sorted(ranks, key=lambda var: ranks[var][0])
+
+    # Scores of different shapes are converted one at a time
+    result = {10: np.array([0.25, 0.75]), 9: np.array([0.25]), 4: 0.75}
+    ranks = add_ranks_to_dict(result, variable_names, argmin_of_mean)
+    assert [9, 10, 4] == sorted(ranks, key=lambda var: ranks[var][0])
+
 
 def test_get_data_subset():
     data = np.array([[0, 1, 2, 3], [1, 2, 3, 4]])
@@ -30,6 +60,23 @@ def test_get_data_subset():
     expected = data
     assert (expected == get_data_subset(data, rows)).all()
 
+    # Contiguous columns are a view rather than a copy
+    expected = np.array([[1, 2], [2, 3]])
+    subset = get_data_subset(data, None, [1, 2])
+    assert (expected == subset).all()
+    assert np.shares_memory(data, subset)
+    # but the view cannot be used to modify the data
+    with pytest.raises(ValueError):
+        subset[0, 0] = -1
+    assert data[0, 1] == 1
+    # Any other subset is a copy
+    subset = get_data_subset(data, None, [2, 1])
+    subset[0, 0] = -1
+    assert data[0, 2] == 2
+    assert (expected == get_data_subset(data, rows, [1, 2])).all()
+    assert (np.array([[3], [4]]) == get_data_subset(data, None, [-1])).all()
+    assert get_data_subset(data, None, []).shape == (2, 0)
+
     A = [1, 2]
     B = [2, 4]
     C = [3, 6]